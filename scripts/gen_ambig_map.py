@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
 
+import sys
+from functools import reduce
+from operator import or_
+
 bases = ['A', 'C', 'G', 'T', 'U']
 
 mapping = [
@@ -16,6 +20,18 @@ mapping = [
     ('N', 'ACGT'),
 ]
 
-for b, bases in mapping:
-    other = [a for a, v in mapping if all(b in bases for b in v)]
-    print("b'{}' => b\"{}\".to_vec(),".format(b, ''.join(list(bases) + other)))
+bits = {c: 1 << i for i, c in enumerate(bases)}
+
+
+def mask(s):
+    return reduce(or_, (bits[c] for c in s))
+
+
+masks = [(a, mask(v)) for a, v in mapping]
+
+lines = []
+for (b, v), (_, mb) in zip(mapping, masks):
+    other = [a for a, m in masks if m & mb == m]
+    lines.append("b'{}' => b\"{}\".to_vec(),\n".format(b, v + ''.join(other)))
+
+sys.stdout.write(''.join(lines))
@@ -3,38 +3,33 @@
 import sys
 import re
 
-prev_line = ''
-in_table = False
-for line in sys.stdin:
-    if line.startswith('---'):
-        prev_line = '### {}\n'.format(re.sub('(.+?Usage: )(.*)', '\\1`\\2`', prev_line))
-        line = next(sys.stdin)
-        if line[0].islower():
-            prev_line = prev_line + '\n| variable | description |\n| - | - '
-            in_table = True
-
-    if in_table:
-        if line.startswith('Example') or len(line) == 0:
-            in_table = False
-        else:
-            #line = line[1:]
-            if line[0] != ' ':
-                prev_line += '|\n'
-                s = line.strip().split(' ', 1)
-                if len(s) == 2:
-                    name, desc = s
-                    line = '| {} | {} '.format(name, desc)
-            else:
-                prev_line += ' ' + line.strip()
-                continue
-
-    if line.startswith('Example'):
-        line = '#### {}\n\n'.format(line.strip())
-
-    elif line.startswith('> '):
-        line = '\n```bash\n{}```\n\n'.format(line[2:])
-
-    print(prev_line, end='')
-    prev_line = line
-
-print(prev_line, end='')
+# header line followed by a line of dashes, optionally followed by a
+# table of variables (starting with a lowercase variable name and ending
+# at the first empty line or at 'Example')
+section_re = re.compile(
+    r'(?m)^(.+?Usage: )(.*)\n---.*\n((?:[a-z].*\n(?:(?!Example).+\n)*)?)')
+row_re = re.compile(r'(?m)^(\S+) (.*)((?:\n .*)*)')
+example_re = re.compile(r'(?m)^(Example.*?)[ \t]*\n')
+cmd_re = re.compile(r'(?m)^> (.*\n)')
+
+
+def fmt_row(m):
+    name, desc, cont = m.groups()
+    cont = ''.join(' ' + l.strip() for l in cont.split('\n')[1:])
+    return '| {} | {} {}|'.format(name, desc.rstrip(), cont)
+
+
+def fmt_section(m):
+    head, usage, table = m.groups()
+    out = '### {}`{}`\n\n'.format(head, usage)
+    if table:
+        out += '\n| variable | description |\n| - | - |\n'
+        out += row_re.sub(fmt_row, table)
+    return out
+
+
+text = sys.stdin.read()
+text = section_re.sub(fmt_section, text)
+text = example_re.sub(r'#### \1\n\n', text)
+text = cmd_re.sub(r'\n```bash\n\1```\n\n', text)
+sys.stdout.write(text)